@@ -0,0 +1,59 @@
+"""
+Startup Benchmark - Measures import, engine construction and warm-up time
+
+Usage: python benchmark_startup.py [runs]
+
+Startup honours WARMUP and HOT_SET_PATH from the environment, so the
+"import + ready" stage includes warm-up and hot-set preseeding when set.
+"""
+
+import subprocess
+import sys
+import statistics
+
+# Each stage runs in a fresh interpreter so import caches are cold
+STAGES = {
+    "import main": "import time; t = time.perf_counter(); import main; print(time.perf_counter() - t)",
+    "build engine": (
+        "import time, main; t = time.perf_counter(); main.get_expert_engine(); "
+        "print(time.perf_counter() - t)"
+    ),
+    "import + ready": (
+        "import time\n"
+        "t = time.perf_counter()\n"
+        "import main\n"
+        "from fastapi.testclient import TestClient\n"
+        "with TestClient(main.app):\n"
+        "    while not main.startup_state['ready']:\n"
+        "        time.sleep(0.0005)\n"
+        "    print(time.perf_counter() - t)"
+    ),
+    "warm-up": (
+        "import time, main; e = main.get_expert_engine(); t = time.perf_counter(); e.warm_up(); "
+        "print(time.perf_counter() - t)"
+    ),
+    "first query (cold)": (
+        "import time, main; e = main.get_expert_engine(); t = time.perf_counter(); "
+        "e.process_query('How do I fix audio dropouts?', {}); print(time.perf_counter() - t)"
+    ),
+    "first query (warm)": (
+        "import time, main; e = main.get_expert_engine(); e.warm_up(); t = time.perf_counter(); "
+        "e.process_query('How do I fix audio dropouts?', {}); print(time.perf_counter() - t)"
+    )
+}
+
+def run_stage(code: str) -> float:
+    """Run a stage in a subprocess and return elapsed seconds"""
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+def main(runs: int = 5):
+    print(f"{'stage':<22}{'median ms':>12}{'min ms':>12}")
+    for name, code in STAGES.items():
+        timings = [run_stage(code) * 1000 for _ in range(runs)]
+        print(f"{name:<22}{statistics.median(timings):>12.2f}{min(timings):>12.2f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -6,6 +6,18 @@ from typing import Dict, List, Optional
 import re
 from difflib import SequenceMatcher
 
+# Sample queries replayed at startup to prime caches
+WARMUP_QUERIES = [
+    "How do I fix audio dropouts?",
+    "How to reduce latency?",
+    "How do I export audio?",
+    "Plugin crash on startup",
+    "MIDI controller not working",
+    "CPU overload during mixing",
+    "Audio routing and sidechain",
+    "Keyboard shortcuts"
+]
+
 class ExpertEngine:
     """
     Expert system engine for Cubase troubleshooting
@@ -15,41 +27,50 @@ class ExpertEngine:
     def __init__(self, knowledge_loader):
         self.knowledge = knowledge_loader
         self.rules = self._load_rules()
+        self.patterns = [re.compile(rule["pattern"], re.IGNORECASE) for rule in self.rules]
+        self.suggestions = self._load_suggestions()
+        self._register_rules()
     
     def _load_rules(self) -> List[Dict]:
         """Load inference rules"""
         return [
             {
+                "id": "rule_audio_dropout",
                 "pattern": r"audio.*dropout|dropout.*audio|crackling|popping",
                 "category": "performance",
                 "keywords": ["buffer", "asio", "latency", "cpu"],
                 "priority": 1
             },
             {
+                "id": "rule_latency",
                 "pattern": r"latency|delay|lag",
                 "category": "performance",
                 "keywords": ["buffer", "asio", "driver", "monitoring"],
                 "priority": 1
             },
             {
+                "id": "rule_export",
                 "pattern": r"export|bounce|render",
                 "category": "workflow",
                 "keywords": ["export", "mixdown", "format", "settings"],
                 "priority": 2
             },
             {
+                "id": "rule_plugin_crash",
                 "pattern": r"plugin.*crash|vst.*crash|crash.*plugin",
                 "category": "stability",
                 "keywords": ["plugin", "vst", "crash", "compatibility"],
                 "priority": 1
             },
             {
+                "id": "rule_midi",
                 "pattern": r"midi.*not.*work|midi.*problem",
                 "category": "midi",
                 "keywords": ["midi", "controller", "input", "routing"],
                 "priority": 2
             },
             {
+                "id": "rule_cpu",
                 "pattern": r"cpu.*high|cpu.*overload|performance",
                 "category": "performance",
                 "keywords": ["cpu", "optimization", "freeze", "render"],
@@ -57,6 +78,26 @@ class ExpertEngine:
             }
         ]
     
+    def _load_suggestions(self) -> Dict[str, List[str]]:
+        """Load actionable suggestions per category"""
+        return {
+            "performance": [
+                "Increase buffer size to 512 or 1024 samples",
+                "Disable unnecessary plugins and tracks",
+                "Check ASIO driver settings"
+            ],
+            "workflow": [
+                "Use File > Export > Audio Mixdown",
+                "Select appropriate file format (WAV/MP3)",
+                "Check export settings for sample rate and bit depth"
+            ]
+        }
+    
+    def _register_rules(self):
+        """Add rule keywords to the topic groups"""
+        for rule in self.rules:
+            self.knowledge.topic_graph.add_group(rule["id"], [rule["category"]] + rule["keywords"])
+    
     def process_query(self, query: str, context: Dict) -> Dict:
         """
         Process user query and generate expert response
@@ -92,11 +133,18 @@ class ExpertEngine:
             "related_topics": related_topics
         }
     
+    def warm_up(self, queries: Optional[List[str]] = None) -> int:
+        """Replay sample queries to prime caches, returns number replayed"""
+        queries = WARMUP_QUERIES if queries is None else queries
+        for query in queries:
+            self.process_query(query, {})
+        return len(queries)
+    
     def _match_rules(self, query: str) -> List[Dict]:
         """Match query against inference rules"""
         matched = []
-        for rule in self.rules:
-            if re.search(rule["pattern"], query, re.IGNORECASE):
+        for rule, pattern in zip(self.rules, self.patterns):
+            if pattern.search(query):
                 matched.append(rule)
         
         # Sort by priority
@@ -155,31 +203,19 @@ class ExpertEngine:
         
         # Rule-based suggestions
         for rule in rules[:2]:
-            if rule["category"] == "performance":
-                suggestions.extend([
-                    "Increase buffer size to 512 or 1024 samples",
-                    "Disable unnecessary plugins and tracks",
-                    "Check ASIO driver settings"
-                ])
-            elif rule["category"] == "workflow":
-                suggestions.extend([
-                    "Use File > Export > Audio Mixdown",
-                    "Select appropriate file format (WAV/MP3)",
-                    "Check export settings for sample rate and bit depth"
-                ])
+            suggestions.extend(self.suggestions.get(rule["category"], []))
         
         # Remove duplicates
         return list(dict.fromkeys(suggestions))[:5]
     
     def _find_related_topics(self, rules: List[Dict], kb_results: List[Dict]) -> List[str]:
-        """Find related topics"""
-        topics = set()
-        
-        for rule in rules:
-            topics.update(rule["keywords"])
+        """Find related topics from the topic groups of matched rules and entries"""
+        # Matched rules count fully, entries by their relevance
+        groups = [(rule["id"], 1.0) for rule in rules]
+        groups.extend((result["id"], result.get("relevance", 0.5)) for result in kb_results[:3])
         
-        for result in kb_results[:3]:
-            if "tags" in result:
-                topics.update(result["tags"])
+        # Categories are shared by many groups, not related topics
+        categories = [rule["category"] for rule in rules]
+        categories.extend(result["category"] for result in kb_results[:3])
         
-        return list(topics)[:5]
+        return self.knowledge.topic_graph.rank_topics(groups, exclude=categories)[:5]
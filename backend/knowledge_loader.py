@@ -7,6 +7,8 @@ import os
 from typing import List, Dict, Optional
 from difflib import SequenceMatcher
 
+from topic_graph import TopicGraph
+
 class KnowledgeLoader:
     """
     Loads and manages the Cubase knowledge base
@@ -17,6 +19,9 @@ class KnowledgeLoader:
         self.kb_path = kb_path
         self.entries = self._load_knowledge_base()
         self.categories = self._build_categories()
+        self.topic_graph = self._build_topic_graph()
+        self.pinned: Dict[str, Dict] = {}
+        self.version = 0
     
     def _load_knowledge_base(self) -> List[Dict]:
         """Load all knowledge base entries"""
@@ -104,13 +109,44 @@ class KnowledgeLoader:
         
         return list(category_map.values())
     
+    def _build_topic_graph(self) -> TopicGraph:
+        """Build topic groups for entries"""
+        graph = TopicGraph()
+        
+        for entry in self.entries:
+            graph.add_group(entry["id"], [entry["category"]] + entry.get("tags", []))
+        
+        return graph
+    
+    def add_entry(self, entry: Dict):
+        """Add or replace a knowledge base entry and update indexes"""
+        self.entries = [e for e in self.entries if e["id"] != entry["id"]]
+        self.entries.append(entry)
+        if entry["id"] in self.pinned:
+            self.pinned[entry["id"]] = entry
+        self.categories = self._build_categories()
+        self.topic_graph.add_group(entry["id"], [entry["category"]] + entry.get("tags", []))
+        self.version += 1
+    
     def get_entry(self, entry_id: str) -> Optional[Dict]:
         """Get specific knowledge base entry"""
+        if entry_id in self.pinned:
+            return self.pinned[entry_id]
         for entry in self.entries:
             if entry["id"] == entry_id:
                 return entry
         return None
     
+    def pin_entries(self, entry_ids: List[str]) -> int:
+        """Index hot entries for direct lookup, returns number pinned by this call"""
+        wanted = set(entry_ids)
+        pinned = 0
+        for entry in self.entries:
+            if entry["id"] in wanted:
+                self.pinned[entry["id"]] = entry
+                pinned += 1
+        return pinned
+    
     def search(self, query: str, category: Optional[str] = None, limit: int = 10) -> List[Dict]:
         """
         Search knowledge base with relevance scoring
@@ -3,26 +3,98 @@ Cubase Expert System Assistant - Main Backend Server
 FastAPI application with expert system engine
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager
 from typing import Optional, List, Dict
-import uvicorn
+import asyncio
+import json
+import os
+import time
 from datetime import datetime
 import logging
 
-from expert_engine import ExpertEngine
-from knowledge_loader import KnowledgeLoader
+from query_analytics import load_hot_set
+from request_control import QueryCoalescer, RateLimiter, ResponseCache, normalize_query, normalize_query_key
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Expert system, built lazily so importing this module stays cheap
+knowledge_loader = None
+expert_engine = None
+WARMUP_ENABLED = os.getenv("WARMUP", "false").lower() == "true"
+HOT_SET_PATH = os.getenv("HOT_SET_PATH", "hot_set.json")
+startup_state = {
+    "ready": False,
+    "startup_seconds": None,
+    "warmup_queries": 0,
+    "hot_queries": 0,
+    "warmup_error": None
+}
+
+def get_expert_engine():
+    """Get the expert engine, building it on first use"""
+    global knowledge_loader, expert_engine
+    if expert_engine is None:
+        from expert_engine import ExpertEngine
+        from knowledge_loader import KnowledgeLoader
+        
+        knowledge_loader = KnowledgeLoader()
+        expert_engine = ExpertEngine(knowledge_loader)
+    return expert_engine
+
+def get_knowledge_loader():
+    """Get the knowledge loader, building the engine on first use"""
+    get_expert_engine()
+    return knowledge_loader
+
+def preseed_hot_set(hot_set: Dict) -> int:
+    """Pin hot entries and cache responses for hot queries, returns queries cached"""
+    engine = get_expert_engine()
+    knowledge = get_knowledge_loader()
+    knowledge.pin_entries([entry["id"] for entry in hot_set.get("entries", [])])
+    
+    queries = [normalize_query(item["query"]) for item in hot_set.get("queries", [])]
+    for query in queries:
+        response_cache.put(normalize_query_key(query, {}), engine.process_query(query, {}), knowledge.version)
+    return len(queries)
+
+async def warm_up(started: float):
+    """Run the optional warm-up and hot-set preseed, then mark the server ready"""
+    try:
+        if WARMUP_ENABLED:
+            startup_state["warmup_queries"] = await run_in_threadpool(get_expert_engine().warm_up)
+        hot_set = load_hot_set(HOT_SET_PATH)
+        if hot_set:
+            startup_state["hot_queries"] = await run_in_threadpool(preseed_hot_set, hot_set)
+    except Exception as e:
+        logger.error(f"Warm-up failed: {str(e)}")
+        startup_state["warmup_error"] = str(e)
+    startup_state["startup_seconds"] = round(time.perf_counter() - started, 4)
+    startup_state["ready"] = True
+    logger.info(f"Ready after {startup_state['startup_seconds']}s")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the expert system on startup and warm it up"""
+    started = time.perf_counter()
+    startup_state.update(ready=False, warmup_queries=0, hot_queries=0, warmup_error=None)
+    get_expert_engine()
+    task = asyncio.create_task(warm_up(started))
+    yield
+    task.cancel()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Cubase Expert System API",
     description="AI-powered Cubase troubleshooting and workflow optimization",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -34,9 +106,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize expert system
-knowledge_loader = KnowledgeLoader()
-expert_engine = ExpertEngine(knowledge_loader)
+# Protect the engine under bursty load
+rate_limiter = RateLimiter(capacity=100, refill_rate=100 / 60, max_clients=10000)
+query_coalescer = QueryCoalescer()
+response_cache = ResponseCache()
 
 # Request/Response Models
 class QueryRequest(BaseModel):
@@ -55,6 +128,13 @@ class HealthResponse(BaseModel):
     version: str
     timestamp: str
 
+class ReadinessResponse(BaseModel):
+    ready: bool
+    startup_seconds: Optional[float] = None
+    warmup_queries: int
+    hot_queries: int = 0
+    warmup_error: Optional[str] = None
+
 class FeedbackRequest(BaseModel):
     query_id: str
     rating: int
@@ -71,17 +151,40 @@ async def health_check():
         "timestamp": datetime.utcnow().isoformat() + "Z"
     }
 
+@app.get("/ready", response_model=ReadinessResponse)
+async def readiness_check():
+    """Readiness endpoint, 503 until startup warm-up has finished"""
+    if not startup_state["ready"]:
+        return JSONResponse(status_code=503, content=startup_state)
+    return startup_state
+
 @app.post("/api/query", response_model=QueryResponse)
-async def query_expert_system(request: QueryRequest):
+async def query_expert_system(request: QueryRequest, http_request: Request):
     """
     Query the expert system with a Cubase-related question
     """
     if not request.query or len(request.query.strip()) == 0:
         raise HTTPException(status_code=400, detail="Query cannot be empty")
     
+    client_id = http_request.client.host if http_request.client else "unknown"
+    if not rate_limiter.allow(client_id):
+        raise HTTPException(status_code=429, detail="Too many requests")
+    
     try:
         logger.info(f"Processing query: {request.query}")
-        result = expert_engine.process_query(request.query, request.context)
+        # Shared results are computed from the same normalized text they are keyed on
+        query = normalize_query(request.query)
+        key = normalize_query_key(query, request.context)
+        result = response_cache.get(key, get_knowledge_loader().version)
+        if result is None:
+            result = await query_coalescer.run(
+                key, get_expert_engine().process_query, query, request.context
+            )
+        logger.info("Query result: " + json.dumps({
+            "query": request.query,
+            "confidence": result["confidence"],
+            "sources": result["sources"]
+        }))
         return result
     except Exception as e:
         logger.error(f"Error processing query: {str(e)}")
@@ -90,7 +193,7 @@ async def query_expert_system(request: QueryRequest):
 @app.get("/api/knowledge/{entry_id}")
 async def get_knowledge_entry(entry_id: str):
     """Get a specific knowledge base entry"""
-    entry = knowledge_loader.get_entry(entry_id)
+    entry = get_knowledge_loader().get_entry(entry_id)
     if not entry:
         raise HTTPException(status_code=404, detail="Knowledge entry not found")
     return entry
@@ -101,7 +204,7 @@ async def search_knowledge(q: str, category: Optional[str] = None, limit: int =
     if not q:
         raise HTTPException(status_code=400, detail="Search query required")
     
-    results = knowledge_loader.search(q, category, limit)
+    results = get_knowledge_loader().search(q, category, limit)
     return {
         "results": results,
         "total": len(results),
@@ -111,7 +214,7 @@ async def search_knowledge(q: str, category: Optional[str] = None, limit: int =
 @app.get("/api/categories")
 async def list_categories():
     """List all knowledge base categories"""
-    categories = knowledge_loader.get_categories()
+    categories = get_knowledge_loader().get_categories()
     return {"categories": categories}
 
 @app.post("/api/feedback")
@@ -132,6 +235,8 @@ async def root():
     }
 
 if __name__ == "__main__":
+    import uvicorn
+    
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
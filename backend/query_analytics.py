@@ -0,0 +1,177 @@
+"""
+Query Analytics - Offline query-log job for KB coverage and hot-set precomputation
+
+Usage: python query_analytics.py LOG [LOG ...] --output hot_set.json
+"""
+
+import argparse
+import heapq
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from request_control import normalize_query
+
+LOG_MARKER = "Query result: "
+
+def read_lines(paths: Iterable[str]) -> Iterator[str]:
+    """Stream lines from one or more log files"""
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="replace") as log_file:
+            for line in log_file:
+                yield line
+
+def parse_records(lines: Iterable[str]) -> Iterator[Dict]:
+    """Extract query result records logged by the query endpoint"""
+    for line in lines:
+        index = line.find(LOG_MARKER)
+        if index == -1:
+            continue
+        try:
+            record = json.loads(line[index + len(LOG_MARKER):])
+        except ValueError:
+            continue
+        if isinstance(record, dict) and record.get("query"):
+            yield record
+
+class SpaceSaving:
+    """
+    Bounded heavy-hitter counter using the Space-Saving algorithm
+    When full, a new key replaces the key with the smallest count and takes
+    over that count plus one; the inherited count is kept as its error.
+    Any key seen more than total / capacity times is guaranteed to be tracked.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.heap: List[Tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.counts
+
+    def add(self, key: str) -> Optional[str]:
+        """Count one occurrence of key, returns the key evicted to make room"""
+        evicted = None
+
+        if key in self.counts:
+            self.counts[key] += 1
+        elif len(self.counts) < self.capacity:
+            self.counts[key] = 1
+            self.errors[key] = 0
+        else:
+            evicted, minimum = self._pop_min()
+            del self.counts[evicted]
+            del self.errors[evicted]
+            self.counts[key] = minimum + 1
+            self.errors[key] = minimum
+
+        heapq.heappush(self.heap, (self.counts[key], key))
+        if len(self.heap) > self.capacity * 2:
+            # Drop stale heap entries so memory stays bounded
+            self.heap = [(count, k) for k, count in self.counts.items()]
+            heapq.heapify(self.heap)
+
+        return evicted
+
+    def most_common(self, top: int) -> List[Tuple[str, int, int]]:
+        """Top keys as (key, count, error), highest count first"""
+        ranked = heapq.nsmallest(top, self.counts.items(), key=lambda item: (-item[1], item[0]))
+        return [(key, count, self.errors[key]) for key, count in ranked]
+
+    def _pop_min(self) -> Tuple[str, int]:
+        """Pop the tracked key with the smallest current count"""
+        while True:
+            count, key = heapq.heappop(self.heap)
+            if self.counts.get(key) == count:
+                return key, count
+
+class QueryStats:
+    """
+    Streaming aggregate of query frequencies, low-confidence queries and served entries
+    Each is a Space-Saving counter, so memory stays bounded by max_tracked
+    """
+
+    def __init__(self, low_confidence: float = 0.7, max_tracked: int = 10000):
+        self.low_confidence = low_confidence
+        self.max_tracked = max_tracked
+        self.total = 0
+        self.queries = SpaceSaving(max_tracked)
+        self.low_confidence_queries = SpaceSaving(max_tracked)
+        self.entries = SpaceSaving(max_tracked)
+        self.confidence: Dict[str, float] = {}
+
+    def add(self, record: Dict):
+        """Add a single query record"""
+        # Same normalization the server keys hot-set responses on
+        query = normalize_query(record["query"])
+        confidence = float(record.get("confidence", 0.0))
+
+        self.total += 1
+        self.queries.add(query)
+        for entry_id in record.get("sources", []):
+            self.entries.add(entry_id)
+
+        if confidence < self.low_confidence:
+            evicted = self.low_confidence_queries.add(query)
+            if evicted is not None:
+                self.confidence.pop(evicted, None)
+            self.confidence[query] = confidence
+
+    def hot_set(self, top: int = 50) -> Dict:
+        """Build the hot set served at startup"""
+        return {
+            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "total_queries": self.total,
+            # Only queries guaranteed to repeat are worth preseeding
+            "queries": [
+                {"query": query, "count": count, "error": error}
+                for query, count, error in self.queries.most_common(top)
+                if count - error > 1
+            ],
+            "entries": [
+                {"id": entry_id, "count": count, "error": error}
+                for entry_id, count, error in self.entries.most_common(top)
+            ],
+            "low_confidence": [
+                {"query": query, "count": count, "error": error, "confidence": self.confidence[query]}
+                for query, count, error in self.low_confidence_queries.most_common(top)
+            ]
+        }
+
+def analyze(paths: Iterable[str], low_confidence: float = 0.7, max_tracked: int = 10000) -> QueryStats:
+    """Aggregate query statistics from log files"""
+    stats = QueryStats(low_confidence, max_tracked)
+    for record in parse_records(read_lines(paths)):
+        stats.add(record)
+    return stats
+
+def load_hot_set(path: str) -> Optional[Dict]:
+    """Load a hot set file, None if missing; invalid files raise so startup can report them"""
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as hot_file:
+        return json.load(hot_file)
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Build a hot set from query logs")
+    parser.add_argument("logs", nargs="+", help="Query log files")
+    parser.add_argument("--output", default="hot_set.json", help="Hot set output path")
+    parser.add_argument("--top", type=int, default=50, help="Entries kept per list")
+    parser.add_argument("--low-confidence", type=float, default=0.7, help="Low confidence threshold")
+    parser.add_argument("--max-tracked", type=int, default=10000, help="Distinct keys tracked per counter")
+    args = parser.parse_args(argv)
+
+    stats = analyze(args.logs, args.low_confidence, args.max_tracked)
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(stats.hot_set(args.top), output_file, indent=2)
+
+    print(f"Analyzed {stats.total} queries, hot set written to {args.output}")
+
+if __name__ == "__main__":
+    main()
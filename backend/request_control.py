@@ -0,0 +1,108 @@
+"""
+Request Control - Per-client rate limiting, in-flight query coalescing and response caching
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter keyed by client
+    Buckets are kept in LRU order and capped at max_clients to bound memory
+    """
+
+    def __init__(self, capacity: int = 20, refill_rate: float = 1.0, max_clients: int = 10000):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.max_clients = max_clients
+        self.buckets: "OrderedDict[str, list]" = OrderedDict()
+
+    def allow(self, client_id: str, now: Optional[float] = None) -> bool:
+        """Consume one token for the client, False if the bucket is empty"""
+        if now is None:
+            now = time.monotonic()
+
+        bucket = self.buckets.get(client_id)
+        if bucket is None:
+            # New clients start with a full bucket
+            bucket = [float(self.capacity), now]
+            self.buckets[client_id] = bucket
+            if len(self.buckets) > self.max_clients:
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(client_id)
+            tokens, last = bucket
+            bucket[0] = min(self.capacity, tokens + (now - last) * self.refill_rate)
+            bucket[1] = now
+
+        if bucket[0] < 1.0:
+            return False
+
+        bucket[0] -= 1.0
+        return True
+
+class QueryCoalescer:
+    """
+    Single-flight execution of identical in-flight calls
+    Concurrent callers with the same key share one computation and result
+    """
+
+    def __init__(self):
+        self.inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, func: Callable, *args) -> Any:
+        """Run func in the threadpool, or join an identical in-flight call"""
+        future = self.inflight.get(key)
+
+        if future is None:
+            future = asyncio.ensure_future(run_in_threadpool(func, *args))
+            self.inflight[key] = future
+            future.add_done_callback(lambda done: self._release(key, done))
+
+        # Shield so one cancelled caller does not cancel the shared call
+        return await asyncio.shield(future)
+
+    def _release(self, key: Hashable, future: asyncio.Future):
+        """Drop a finished call from the in-flight table"""
+        if self.inflight.get(key) is future:
+            del self.inflight[key]
+
+class ResponseCache:
+    """
+    Responses precomputed for hot-set queries
+    Each response records the knowledge base version it was built from,
+    and is ignored once the knowledge base has changed
+    """
+
+    def __init__(self):
+        self.responses: Dict[Hashable, tuple] = {}
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable, version: int) -> Optional[Any]:
+        """Get a cached response, None on miss or if built from an older version"""
+        with self.lock:
+            cached = self.responses.get(key)
+        if cached is None or cached[0] != version:
+            return None
+        return cached[1]
+
+    def put(self, key: Hashable, value: Any, version: int):
+        """Cache a response built from the given knowledge base version"""
+        with self.lock:
+            self.responses[key] = (version, value)
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace so equivalent queries share one computation"""
+    return " ".join(query.split())
+
+def normalize_query_key(query: str, context: Optional[Dict[str, str]]) -> Hashable:
+    """
+    Build the coalescing key for a query and its context
+    Case is kept, since the answer echoes the query text passed to the engine
+    """
+    return normalize_query(query), tuple(sorted((context or {}).items()))
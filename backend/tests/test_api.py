@@ -108,3 +108,79 @@ def test_submit_feedback():
     assert response.status_code == 200
     data = response.json()
     assert data["success"] is True
+
+def test_query_endpoint_rate_limited(monkeypatch):
+    """Test query rate limiting per client"""
+    import main
+    from request_control import RateLimiter
+    
+    monkeypatch.setattr(main, "rate_limiter", RateLimiter(capacity=1, refill_rate=0.0))
+    
+    first = client.post("/api/query", json={"query": "latency"})
+    second = client.post("/api/query", json={"query": "latency"})
+    
+    assert first.status_code == 200
+    assert second.status_code == 429
+
+def test_readiness_after_startup():
+    """Test readiness is reported once warm-up has finished"""
+    import time
+    
+    with TestClient(app) as startup_client:
+        for _ in range(50):
+            response = startup_client.get("/ready")
+            if response.status_code == 200:
+                break
+            time.sleep(0.05)
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["ready"] is True
+    assert data["startup_seconds"] is not None
+    assert data["warmup_error"] is None
+
+def test_readiness_reports_preseed_failure(monkeypatch, tmp_path):
+    """Test a broken hot set is reported by the readiness endpoint"""
+    import time
+    import main
+    
+    hot_set_path = tmp_path / "hot_set.json"
+    hot_set_path.write_text('{"queries": [{"count": 3}]}')
+    monkeypatch.setattr(main, "HOT_SET_PATH", str(hot_set_path))
+    
+    with TestClient(app) as startup_client:
+        for _ in range(50):
+            response = startup_client.get("/ready")
+            if response.status_code == 200:
+                break
+            time.sleep(0.05)
+    
+    data = response.json()
+    assert data["warmup_error"] is not None
+    assert data["hot_queries"] == 0
+
+def test_preseed_hot_set():
+    """Test hot set preseeds the response cache"""
+    import main
+    from request_control import normalize_query_key
+    
+    hot_set = {
+        "queries": [{"query": "How do I export audio?", "count": 3}],
+        "entries": [{"id": "kb_export_001", "count": 3}]
+    }
+    
+    knowledge = main.get_knowledge_loader()
+    key = normalize_query_key("How do I export audio?", {})
+    
+    assert main.preseed_hot_set(hot_set) == 1
+    assert main.response_cache.get(key, knowledge.version) is not None
+    assert main.response_cache.get(normalize_query_key("Plugin crash", {}), knowledge.version) is None
+    assert "kb_export_001" in knowledge.pinned
+
+def test_query_endpoint_shared_answer_matches_query():
+    """Test shared results echo the query text they were computed from"""
+    first = client.post("/api/query", json={"query": "Plugin Crash"})
+    second = client.post("/api/query", json={"query": "plugin   crash"})
+    
+    assert "Regarding Plugin Crash:" in first.json()["answer"]
+    assert "Regarding plugin crash:" in second.json()["answer"]
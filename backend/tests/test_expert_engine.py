@@ -66,3 +66,22 @@ def test_related_topics(expert_engine):
     
     assert len(result["related_topics"]) > 0
     assert isinstance(result["related_topics"], list)
+
+def test_related_topics_ranked(expert_engine):
+    """Test related topics are ranked from the matched rule and entries"""
+    result = expert_engine.process_query("midi not working", {})
+    
+    assert result["related_topics"] == ["controller", "input", "routing", "setup", "troubleshooting"]
+
+def test_related_topics_follow_matched_entry(expert_engine):
+    """Test a shortcuts query gets its own topics and no export advice"""
+    result = expert_engine.process_query("keyboard shortcuts", {})
+    
+    assert result["related_topics"][:3] == ["keyboard", "productivity", "shortcuts"]
+    assert not {"export", "mixdown"} & set(result["related_topics"])
+    assert result["suggestions"] == []
+
+def test_warm_up(expert_engine):
+    """Test warm-up replays sample queries"""
+    assert expert_engine.warm_up(["latency", "export"]) == 2
+    assert expert_engine.warm_up() > 0
@@ -67,3 +67,32 @@ def test_search_limit(knowledge_loader):
     results = knowledge_loader.search("cubase", limit=3)
     
     assert len(results) <= 3
+
+def test_topic_graph(knowledge_loader):
+    """Test topic graph is built from entries"""
+    topics = knowledge_loader.topic_graph.rank_topics([("kb_midi_001", 1.0)])
+    
+    assert "controller" in topics
+    assert "midi" in topics
+
+def test_add_entry(knowledge_loader):
+    """Test adding an entry updates indexes"""
+    knowledge_loader.add_entry({
+        "id": "kb_test_001",
+        "title": "Test Entry",
+        "category": "mixing",
+        "content": "Test content",
+        "tags": ["eq", "compression"]
+    })
+    
+    assert knowledge_loader.get_entry("kb_test_001") is not None
+    assert any(c["id"] == "mixing" for c in knowledge_loader.get_categories())
+    assert "eq" in knowledge_loader.topic_graph.rank_topics([("kb_test_001", 1.0)])
+    assert knowledge_loader.version == 1
+
+def test_pin_entries(knowledge_loader):
+    """Test pinning hot entries"""
+    assert knowledge_loader.pin_entries(["kb_audio_001", "kb_nonexistent"]) == 1
+    assert knowledge_loader.pin_entries(["kb_cpu_001"]) == 1
+    assert set(knowledge_loader.pinned) == {"kb_audio_001", "kb_cpu_001"}
+    assert knowledge_loader.get_entry("kb_audio_001")["id"] == "kb_audio_001"
@@ -0,0 +1,95 @@
+"""
+Unit tests for Query Analytics
+"""
+
+import json
+import pytest
+from query_analytics import QueryStats, SpaceSaving, analyze, load_hot_set, main, parse_records
+
+LOG_LINES = [
+    'INFO:main:Processing query: How to reduce latency?\n',
+    'INFO:main:Query result: {"query": "How to reduce latency?", "confidence": 0.95, "sources": ["kb_latency_001"]}\n',
+    'INFO:main:Query result: {"query": "How to  reduce latency?", "confidence": 0.95, "sources": ["kb_latency_001"]}\n',
+    'INFO:main:Query result: {"query": "vocal tuning", "confidence": 0.6, "sources": []}\n',
+    'INFO:main:Query result: not json\n'
+]
+
+@pytest.fixture
+def query_log(tmp_path):
+    """Write a sample query log"""
+    path = tmp_path / "query.log"
+    path.write_text("".join(LOG_LINES))
+    return str(path)
+
+def test_parse_records():
+    """Test only query result lines are parsed"""
+    records = list(parse_records(LOG_LINES))
+    
+    assert len(records) == 3
+    assert records[0]["sources"] == ["kb_latency_001"]
+
+def test_analyze(query_log):
+    """Test query frequencies, entries and low-confidence queries"""
+    hot_set = analyze([query_log]).hot_set()
+    
+    assert hot_set["total_queries"] == 3
+    assert hot_set["queries"][0] == {"query": "How to reduce latency?", "count": 2, "error": 0}
+    assert hot_set["entries"] == [{"id": "kb_latency_001", "count": 2, "error": 0}]
+    assert hot_set["low_confidence"][0]["query"] == "vocal tuning"
+
+def test_bounded_counters():
+    """Test counters stay within their bound"""
+    stats = QueryStats(max_tracked=2)
+    for i in range(10):
+        stats.add({"query": f"query {i}", "confidence": 0.1, "sources": []})
+    
+    assert len(stats.queries) == 2
+    assert len(stats.low_confidence_queries) == 2
+    assert set(stats.confidence) == set(stats.low_confidence_queries.counts)
+    assert len(stats.queries.heap) <= 4
+
+def test_space_saving_eviction():
+    """Test a new key takes over the evicted minimum count as error"""
+    counter = SpaceSaving(2)
+    for key in ["a", "a", "b"]:
+        counter.add(key)
+    
+    assert counter.add("c") == "b"
+    assert counter.most_common(2) == [("a", 2, 0), ("c", 2, 1)]
+
+def test_late_frequent_query_survives():
+    """Test a frequent query first seen after the counters are full makes the hot set"""
+    stats = QueryStats(max_tracked=100)
+    for i in range(3000):
+        stats.add({"query": f"one-off {i}", "confidence": 0.4, "sources": []})
+    for i in range(17):
+        stats.add({"query": "vocal tuning", "confidence": 0.4, "sources": []})
+        stats.add({"query": f"late one-off {i}", "confidence": 0.4, "sources": []})
+    
+    hot_set = stats.hot_set(3)
+    
+    assert hot_set["queries"][0]["query"] == "vocal tuning"
+    assert hot_set["low_confidence"][0]["query"] == "vocal tuning"
+    assert hot_set["low_confidence"][0]["confidence"] == 0.4
+    assert hot_set["queries"][0]["count"] - hot_set["queries"][0]["error"] <= 17
+    assert [q["query"] for q in hot_set["queries"]] == ["vocal tuning"]
+
+def test_main_writes_hot_set(query_log, tmp_path):
+    """Test CLI writes a loadable hot set"""
+    output = tmp_path / "hot_set.json"
+    main([query_log, "--output", str(output), "--top", "1"])
+    
+    hot_set = load_hot_set(str(output))
+    assert len(hot_set["queries"]) == 1
+
+def test_load_missing_hot_set(tmp_path):
+    """Test missing hot set file"""
+    assert load_hot_set(str(tmp_path / "missing.json")) is None
+
+def test_load_invalid_hot_set(tmp_path):
+    """Test an invalid hot set file raises"""
+    path = tmp_path / "hot_set.json"
+    path.write_text("not json")
+    
+    with pytest.raises(ValueError):
+        load_hot_set(str(path))
@@ -0,0 +1,90 @@
+"""
+Unit tests for Request Control
+"""
+
+import asyncio
+import threading
+import pytest
+from request_control import QueryCoalescer, RateLimiter, ResponseCache, normalize_query, normalize_query_key
+
+@pytest.fixture
+def rate_limiter():
+    """Create rate limiter instance"""
+    return RateLimiter(capacity=2, refill_rate=1.0, max_clients=2)
+
+def test_rate_limit_exhausts_bucket(rate_limiter):
+    """Test requests beyond capacity are rejected"""
+    assert rate_limiter.allow("client", now=0.0)
+    assert rate_limiter.allow("client", now=0.0)
+    assert not rate_limiter.allow("client", now=0.0)
+
+def test_rate_limit_refills(rate_limiter):
+    """Test tokens refill over time"""
+    rate_limiter.allow("client", now=0.0)
+    rate_limiter.allow("client", now=0.0)
+    
+    assert rate_limiter.allow("client", now=1.0)
+    assert not rate_limiter.allow("client", now=1.0)
+
+def test_rate_limit_per_client(rate_limiter):
+    """Test buckets are independent per client"""
+    rate_limiter.allow("a", now=0.0)
+    rate_limiter.allow("a", now=0.0)
+    
+    assert rate_limiter.allow("b", now=0.0)
+
+def test_rate_limit_bounded_memory(rate_limiter):
+    """Test least recently used clients are evicted"""
+    for client in ["a", "b", "c"]:
+        rate_limiter.allow(client, now=0.0)
+    
+    assert len(rate_limiter.buckets) == 2
+    assert "a" not in rate_limiter.buckets
+
+def test_normalize_query_key():
+    """Test queries differing only in whitespace share a key"""
+    first = normalize_query_key("  Audio   Dropout ", {"version": "13"})
+    second = normalize_query_key("Audio Dropout", {"version": "13"})
+    
+    assert first == second
+    assert first[0] == normalize_query("  Audio   Dropout ")
+    assert first != normalize_query_key("audio dropout", {"version": "13"})
+    assert first != normalize_query_key("Audio Dropout", {})
+
+def test_coalesce_identical_queries():
+    """Test concurrent identical calls share one computation"""
+    coalescer = QueryCoalescer()
+    calls = []
+    release = threading.Event()
+    
+    def compute(value):
+        calls.append(value)
+        release.wait(timeout=5)
+        return {"value": value}
+    
+    async def run_burst():
+        tasks = [asyncio.ensure_future(coalescer.run("key", compute, 1)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*tasks)
+    
+    results = asyncio.run(run_burst())
+    
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert coalescer.inflight == {}
+
+def test_response_cache_hit():
+    """Test cached responses are returned for their version"""
+    cache = ResponseCache()
+    cache.put("hot", {"answer": "a"}, version=0)
+    
+    assert cache.get("hot", version=0) == {"answer": "a"}
+    assert cache.get("cold", version=0) is None
+
+def test_response_cache_stale_version():
+    """Test responses built from an older knowledge base are ignored"""
+    cache = ResponseCache()
+    cache.put("hot", {"answer": "a"}, version=0)
+    
+    assert cache.get("hot", version=1) is None
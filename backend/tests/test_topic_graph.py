@@ -0,0 +1,52 @@
+"""
+Unit tests for Topic Graph
+"""
+
+import pytest
+from topic_graph import TopicGraph
+
+@pytest.fixture
+def topic_graph():
+    """Create topic graph instance"""
+    graph = TopicGraph()
+    graph.add_group("a", ["performance", "buffer", "asio"])
+    graph.add_group("b", ["performance", "cpu", "asio", "freeze"])
+    return graph
+
+def test_strength(topic_graph):
+    """Test strength counts topics sharing a group"""
+    assert topic_graph.strength["performance"] == 5
+    assert topic_graph.strength["buffer"] == 2
+    assert topic_graph.strength["cpu"] == 3
+
+def test_rank_topics(topic_graph):
+    """Test topics of weighted groups are ranked by score"""
+    ranked = topic_graph.rank_topics([("a", 1.0), ("b", 0.5)], exclude=["performance"])
+
+    assert ranked == ["asio", "buffer", "cpu", "freeze"]
+
+def test_rank_topics_tie_break(topic_graph):
+    """Test ties go to less connected topics"""
+    ranked = topic_graph.rank_topics([("a", 1.0)])
+
+    assert ranked == ["buffer", "asio", "performance"]
+
+def test_rank_unknown_group(topic_graph):
+    """Test ranking unknown groups"""
+    assert topic_graph.rank_topics([("unknown", 1.0)]) == []
+
+def test_replace_group(topic_graph):
+    """Test re-adding a group replaces its previous topics"""
+    topic_graph.add_group("b", ["performance", "latency"])
+
+    assert "cpu" not in topic_graph.strength
+    assert topic_graph.strength["performance"] == 3
+    assert topic_graph.rank_topics([("b", 1.0)]) == ["latency", "performance"]
+
+def test_remove_group(topic_graph):
+    """Test removing a group updates strength"""
+    topic_graph.remove_group("a")
+
+    assert "buffer" not in topic_graph.strength
+    assert topic_graph.strength["performance"] == 3
+    assert topic_graph.rank_topics([("a", 1.0)]) == []
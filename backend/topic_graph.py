@@ -0,0 +1,54 @@
+"""
+Topic Graph - Topic groups of KB entries and rules with co-occurrence strength
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+class TopicGraph:
+    """
+    Topic groups keyed by KB entry or inference rule id
+    Each topic's co-occurrence strength (how many other topics it shares a
+    group with) is kept up to date as groups are added and removed, and is
+    used to break ties when ranking the topics of matched groups.
+    """
+
+    def __init__(self):
+        self.groups: Dict[str, List[str]] = {}
+        self.strength: Dict[str, int] = {}
+
+    def add_group(self, group_id: str, topics: Iterable[str]):
+        """Add or replace a group of co-occurring topics"""
+        if group_id in self.groups:
+            self.remove_group(group_id)
+
+        members = list(dict.fromkeys(t.lower() for t in topics if t))
+        self.groups[group_id] = members
+        self._update_strength(members, 1)
+
+    def remove_group(self, group_id: str):
+        """Remove a group and its co-occurrence strength"""
+        members = self.groups.pop(group_id, None)
+        if members:
+            self._update_strength(members, -1)
+
+    def rank_topics(self, groups: Iterable[Tuple[str, float]], exclude: Iterable[str] = ()) -> List[str]:
+        """Rank the topics of weighted groups, strongest first"""
+        scores: Dict[str, float] = {}
+        for group_id, weight in groups:
+            for topic in self.groups.get(group_id, []):
+                scores[topic] = scores.get(topic, 0.0) + weight
+
+        for topic in exclude:
+            scores.pop(topic.lower(), None)
+
+        # Break score ties in favour of more specific (less connected) topics
+        return sorted(scores, key=lambda t: (-scores[t], self.strength.get(t, 0), t))
+
+    def _update_strength(self, members: List[str], delta: int):
+        """Adjust strength for the members of a single group"""
+        for topic in members:
+            strength = self.strength.get(topic, 0) + delta * (len(members) - 1)
+            if strength > 0:
+                self.strength[topic] = strength
+            else:
+                self.strength.pop(topic, None)